@@ -1,3 +1,46 @@
+import functools
+
+try:
+    from functools import lru_cache
+except ImportError:
+    lru_cache = None  # type: ignore
+
+
+def cached(maxsize):
+    """
+    Memoize a function on its positional arguments.
+
+    Calls with keyword or unhashable arguments bypass the cache. On
+    interpreters without :func:`functools.lru_cache` the function is
+    returned unchanged.
+
+    :param maxsize: Maximum number of entries kept in the cache.
+
+    """
+
+    def decorator(function):
+        if lru_cache is None:
+            return function
+
+        cached_function = lru_cache(maxsize=maxsize)(function)
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if kwargs:
+                return function(*args, **kwargs)
+            try:
+                hash(args)
+            except TypeError:
+                return function(*args)
+            return cached_function(*args)
+
+        wrapper.cache_clear = cached_function.cache_clear  # type: ignore
+        return wrapper  # type: ignore
+
+    return decorator
+
+
+@cached(maxsize=1024)
 def is_newtype(type_):
     return (
         hasattr(type_, "__name__")
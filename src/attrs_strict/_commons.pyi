@@ -1,4 +1,12 @@
 import typing
 
+_F = typing.TypeVar("_F", bound=typing.Callable[..., typing.Any])
+
+def cached(maxsize: int) -> typing.Callable[[_F], _F]:
+    def decorator(function: _F) -> _F:
+        def wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Any: ...
+        return wrapper
+    return decorator
+
 def is_newtype(type_: typing.Type[typing.Any]) -> bool: ...
 def format_type(type_: typing.Type[typing.Any]) -> str: ...
@@ -1,9 +1,11 @@
 import collections
+import types
 import typing
+import weakref
 
 import attr
 
-from ._commons import is_newtype
+from ._commons import cached, is_newtype
 from ._error import (
     AttributeTypeError,
     BadTypeError,
@@ -36,25 +38,39 @@ except ImportError:
     from typing import _ForwardRef as ForwardRef  # type: ignore # Not in stubs
 
 
+_UNION = typing.Union
+_NONE_TYPE = type(None)
+
+# Builtins checked by exact type rather than isinstance with strict_types.
+_EXACT_TYPES = frozenset({bool, bytes, float, int, str})
+
+# Signatures of plain functions, held weakly so that validated functions can
+# still be garbage collected.
+_SIGNATURES = weakref.WeakKeyDictionary()
+
+
 class _StringAnnotationError(Exception):
     """Raised when we find string annotations in a class."""
 
 
 class SimilarTypes:
-    Dict = {
-        dict,
-        collections.OrderedDict,
-        collections.defaultdict,
-        Mapping,
-        MutableMapping,
-        typing.Dict,
-        typing.DefaultDict,
-        typing.Mapping,
-        typing.MutableMapping,
-    }
-    List = {set, list, typing.List, typing.Set}
-    Tuple = {tuple, typing.Tuple}
-    Callable = {typing.Callable, Callable}
+    Dict = frozenset(
+        {
+            dict,
+            collections.OrderedDict,
+            collections.defaultdict,
+            Mapping,
+            MutableMapping,
+            typing.Dict,
+            typing.DefaultDict,
+            typing.Mapping,
+            typing.MutableMapping,
+        }
+    )
+    List = frozenset({set, list, typing.List, typing.Set})
+    Tuple = frozenset({tuple, typing.Tuple})
+    Callable = frozenset({typing.Callable, Callable})
+    Collections = Dict | List | Tuple | Callable
 
 
 def resolve_types(cls, global_ns=None, local_ns=None):
@@ -77,13 +93,18 @@ def resolve_types(cls, global_ns=None, local_ns=None):
             object.__setattr__(field, "type", hints[field.name])
 
 
-def type_validator(empty_ok=True):
+def type_validator(empty_ok=True, strict_types=False):
     """
     Validates the attributes using the type argument specified. If the
     type argument is not present, the attribute is considered valid.
 
     :param empty_ok: Boolean flag that indicates if the field can be empty
                      in case of a collection or None for builtin types.
+    :param strict_types: Boolean flag that indicates if values of the
+                         builtin ``bool``, ``bytes``, ``float``, ``int`` and
+                         ``str`` types must match exactly, rejecting
+                         instances of their subclasses (e.g. ``True`` for an
+                         ``int``), including inside containers and unions.
 
     """
 
@@ -91,22 +112,139 @@ def type_validator(empty_ok=True):
         if not empty_ok and not field:
             raise EmptyError(field, attribute)
 
+        cls = type(instance)
+        validators = cls.__dict__.get("__attrs_strict_validators__")
+        validate = (
+            None
+            if validators is None
+            else validators.get((attribute.name, strict_types))
+        )
+        if validate is None:
+            validate = _install_validator(cls, attribute, strict_types)
+
         try:
-            _validate_elements(attribute, field, attribute.type)
+            validate(attribute, field)
         except _StringAnnotationError:
-            resolve_types(type(instance))
-            _validate_elements(attribute, field, attribute.type)
+            resolve_types(cls)
+            # Validators compiled before resolution only saw the strings.
+            if "__attrs_strict_validators__" in cls.__dict__:
+                delattr(cls, "__attrs_strict_validators__")
+            _compile_validator(attribute.type, strict_types)(attribute, field)
 
     return _validator
 
 
-def _validate_elements(attribute, value, expected_type):
-    if expected_type is None:
+def _install_validator(cls, attribute, strict_types):
+    """
+    Compile the validator of *attribute* and store it on *cls*.
+
+    Validators are kept in a ``__attrs_strict_validators__`` dictionary on
+    the class, keyed by attribute name and *strict_types*, so that later
+    instances skip hashing the attribute type. Classes that do not accept
+    new attributes get the compiled validator without it being stored.
+
+    """
+    validate = _compile_validator(attribute.type, strict_types)
+
+    validators = cls.__dict__.get("__attrs_strict_validators__")
+    if validators is None:
+        validators = {}
+        try:
+            setattr(cls, "__attrs_strict_validators__", validators)
+        except (AttributeError, TypeError):
+            return validate
+
+    validators[(attribute.name, strict_types)] = validate
+    return validate
+
+
+@cached(maxsize=1024)
+def _compile_validator(expected_type, strict_types=False):
+    """
+    Build a function validating values against *expected_type*.
+
+    The returned function takes ``(attribute, value)``. Plain classes and
+    lists or sets of plain classes get a dedicated closure, every other type
+    is validated through :func:`_validate_elements`. With *strict_types*,
+    the builtins in ``_EXACT_TYPES`` are compared by identity of
+    ``type(value)``.
+
+    """
+    if expected_type is None or expected_type is typing.Any:
+        return _validate_nothing
+
+    if _is_plain_class(expected_type) and expected_type not in _HANDLERS:
+        return _instance_validator(expected_type, strict_types)
+
+    base_type = _get_base_type(expected_type)
+    args = getattr(expected_type, "__args__", None)
+    if (
+        base_type in SimilarTypes.List
+        and args is not None
+        and _is_plain_class(args[0])
+    ):
+        (element_type,) = args
+        return _set_or_list_validator(base_type, element_type, strict_types)
+
+    def _validate_attribute_type(attribute, value):
+        # Reads the type from the attribute so that annotations patched by
+        # resolve_types are picked up.
+        _validate_elements(attribute, value, attribute.type, strict_types)
+
+    return _validate_attribute_type
+
+
+def _instance_validator(expected_type, strict_types):
+    def _validate_exact_instance(attribute, value):
+        if type(value) is not expected_type:
+            raise AttributeTypeError(value, attribute)
+
+    def _validate_instance(attribute, value):
+        if not isinstance(value, expected_type):
+            raise AttributeTypeError(value, attribute)
+
+    if strict_types and expected_type in _EXACT_TYPES:
+        return _validate_exact_instance
+    return _validate_instance
+
+
+def _set_or_list_validator(container_type, element_type, strict_types):
+    def _validate_exact_set_or_list(attribute, value):
+        if not isinstance(value, container_type):
+            raise AttributeTypeError(value, attribute)
+        for element in value:
+            if type(element) is not element_type:
+                raise _element_type_error(attribute, element, value)
+
+    def _validate_set_or_list(attribute, value):
+        if not isinstance(value, container_type):
+            raise AttributeTypeError(value, attribute)
+        for element in value:
+            if not isinstance(element, element_type):
+                raise _element_type_error(attribute, element, value)
+
+    if strict_types and element_type in _EXACT_TYPES:
+        return _validate_exact_set_or_list
+    return _validate_set_or_list
+
+
+def _validate_nothing(attribute, value):
+    pass
+
+
+def _is_instance(value, type_, strict_types):
+    if strict_types and type_ in _EXACT_TYPES:
+        return type(value) is type_
+    return isinstance(value, type_)
+
+
+def _validate_elements(attribute, value, expected_type, strict_types=False):
+    if expected_type is None or expected_type is typing.Any:
         return
 
     base_type = _get_base_type(expected_type)
 
-    if base_type == typing.Any:
+    if base_type is typing.Any:
         return
 
     if isinstance(base_type, (str, ForwardRef)):
@@ -114,26 +252,23 @@ def _validate_elements(attribute, value, expected_type):
         # be used in isinstance.
         raise _StringAnnotationError()
 
-    if base_type != typing.Union and not isinstance(  # type: ignore
-        value, base_type
-    ):
+    if base_type is _UNION:  # type: ignore
+        _handle_union(attribute, value, expected_type, strict_types)
+        return
+
+    if not _is_instance(value, base_type, strict_types):
         raise AttributeTypeError(value, attribute)
 
-    if base_type == typing.Union:  # type: ignore
-        _handle_union(attribute, value, expected_type)
-    elif base_type in SimilarTypes.List:
-        _handle_set_or_list(attribute, value, expected_type)
-    elif base_type in SimilarTypes.Dict:
-        _handle_dict(attribute, value, expected_type)
-    elif base_type in SimilarTypes.Tuple:
-        _handle_tuple(attribute, value, expected_type)
-    elif base_type in SimilarTypes.Callable:  # type: ignore
-        _handle_callable(attribute, value, expected_type)
+    handler = _HANDLERS.get(base_type)
+    if handler is not None:
+        handler(attribute, value, expected_type, strict_types)
 
 
+@cached(maxsize=4096)
 def _get_base_type(type_):
-    if hasattr(type_, "__origin__") and type_.__origin__ is not None:
-        base_type = type_.__origin__  # type: typing.Type[typing.Any]
+    origin = getattr(type_, "__origin__", None)
+    if origin is not None:
+        base_type = origin  # type: typing.Type[typing.Any]
     elif is_newtype(type_):
         base_type = type_.__supertype__
     else:
@@ -142,112 +277,277 @@ def _get_base_type(type_):
     return base_type
 
 
+@cached(maxsize=4096)
+def _is_plain_class(type_):
+    """Whether a value can be validated against *type_* by isinstance alone."""
+    return (
+        isinstance(type_, type)
+        and type_ is not typing.Any
+        and not hasattr(type_, "__origin__")
+        and not is_newtype(type_)
+    )
+
+
+@cached(maxsize=1024)
+def _plain_classes(types):
+    """Return *types* if all of them are plain classes, ``None`` otherwise."""
+    if all(_is_plain_class(type_) for type_ in types):
+        return types
+    return None
+
+
+def _element_type_error(attribute, element, container):
+    error = AttributeTypeError(element, attribute)
+    error.add_container(container)
+    return error
+
+
 def _type_matching(actual, expected):
-    actual = actual.__supertype__ if is_newtype(actual) else actual
-    expected = expected.__supertype__ if is_newtype(expected) else expected
+    pending = [(actual, expected)]
+    while pending:
+        actual, expected = pending.pop()
+        actual = actual.__supertype__ if is_newtype(actual) else actual
+        expected = expected.__supertype__ if is_newtype(expected) else expected
 
-    if expected == actual or expected == typing.Any:
-        return True
+        if expected == actual or expected == typing.Any:
+            continue
 
-    base_type = _get_base_type(expected)
+        base_type = _get_base_type(expected)
 
-    if base_type == typing.Union:  # type: ignore
-        return any(
-            _type_matching(actual, expected_candidate)
-            for expected_candidate in expected.__args__
-        )
+        if base_type is _UNION:  # type: ignore
+            if not any(
+                _type_matching(actual, expected_candidate)
+                for expected_candidate in expected.__args__
+            ):
+                return False
+
+        elif base_type in SimilarTypes.Collections:
+            actual_args = getattr(actual, "__args__", ())
+            expected_args = getattr(expected, "__args__", ())
+            if len(actual_args) != len(expected_args):
+                return False
+            pending.extend(zip(actual_args, expected_args))
+
+        else:
+            return False
+
+    return True
 
-    elif base_type in (
-        SimilarTypes.Dict
-        | SimilarTypes.List
-        | SimilarTypes.Tuple
-        | SimilarTypes.Callable
+
+def _callable_signature(callable_):
+    """
+    Return the signature of *callable_* and its argument annotations.
+
+    Results for plain functions are cached without keeping the functions
+    alive. Bound methods reuse the entry of their underlying function, so
+    the instances they are bound to are not referenced by the cache either.
+    Other callables are inspected on every call.
+
+    """
+    if isinstance(callable_, types.FunctionType):
+        return _function_signature(callable_)
+
+    if (
+        isinstance(callable_, types.MethodType)
+        and callable_.__self__ is not None
+        and isinstance(callable_.__func__, types.FunctionType)
     ):
-        return all(
-            _type_matching(actual, expected)
-            for actual, expected in zip_longest(
-                actual.__args__, expected.__args__
+        _signature, callable_args = _function_signature(callable_.__func__)
+        parameters = tuple(_signature.parameters.values())
+        if parameters and parameters[0].kind in (
+            parameters[0].POSITIONAL_ONLY,
+            parameters[0].POSITIONAL_OR_KEYWORD,
+        ):
+            # Drop the parameter bound to __self__, as signature() does.
+            return (
+                _signature.replace(parameters=parameters[1:]),
+                callable_args[1:],
             )
-        )
 
-    return False
+    return _compute_signature(callable_)
 
 
-def _handle_callable(attribute, callable_, expected_type):
+def _function_signature(function):
+    try:
+        return _SIGNATURES[function]
+    except KeyError:
+        result = _SIGNATURES[function] = _compute_signature(function)
+        return result
+
+
+def _compute_signature(callable_):
     _signature = signature(callable_)
-    callable_args = [
+    callable_args = tuple(
         param.annotation for param in _signature.parameters.values()
-    ]
-    callable_args.append(_signature.return_annotation)
-    if not getattr(expected_type, "__args__", None):  # type: ignore
+    ) + (_signature.return_annotation,)
+    return _signature, callable_args
+
+
+def _handle_callable(attribute, callable_, expected_type, strict_types=False):
+    _signature, callable_args = _callable_signature(callable_)
+    expected_args = getattr(expected_type, "__args__", None)
+    if not expected_args:
         return  # No annotations specified on type, matches all Callables
 
-    for callable_arg, expected_arg in zip_longest(
-        callable_args, expected_type.__args__  # type: ignore
-    ):
+    for callable_arg, expected_arg in zip_longest(callable_args, expected_args):
         if not _type_matching(callable_arg, expected_arg):
             raise CallableError(
                 attribute, _signature, expected_type, callable_arg, expected_arg
             )
 
 
-def _handle_set_or_list(attribute, container, expected_type):
+def _handle_set_or_list(
+    attribute, container, expected_type, strict_types=False
+):
     (element_type,) = expected_type.__args__  # type: ignore
+    _handle_homogeneous(attribute, container, element_type, strict_types)
+
+
+def _handle_homogeneous(attribute, container, element_type, strict_types):
+    if strict_types and element_type in _EXACT_TYPES:
+        for element in container:
+            if type(element) is not element_type:
+                raise _element_type_error(attribute, element, container)
+        return
+
+    if _is_plain_class(element_type):
+        for element in container:
+            if not isinstance(element, element_type):
+                raise _element_type_error(attribute, element, container)
+        return
 
     for element in container:
         try:
-            _validate_elements(attribute, element, element_type)
+            _validate_elements(attribute, element, element_type, strict_types)
         except BadTypeError as error:
             error.add_container(container)
             raise error
 
 
-def _handle_dict(attribute, container, expected_type):
+def _handle_dict(attribute, container, expected_type, strict_types=False):
     key_type, value_type = expected_type.__args__  # type: ignore
 
+    if _is_plain_class(key_type) and _is_plain_class(value_type):
+        for key in container:
+            if not _is_instance(key, key_type, strict_types):
+                raise _element_type_error(attribute, key, container)
+            value = container[key]
+            if not _is_instance(value, value_type, strict_types):
+                raise _element_type_error(attribute, value, container)
+        return
+
     for key in container:
         try:
-            _validate_elements(attribute, key, key_type)
-            _validate_elements(attribute, container[key], value_type)
+            _validate_elements(attribute, key, key_type, strict_types)
+            _validate_elements(
+                attribute, container[key], value_type, strict_types
+            )
         except BadTypeError as error:
             error.add_container(container)
             raise error
 
 
-def _handle_tuple(attribute, container, expected_type):
+def _handle_tuple(attribute, container, expected_type, strict_types=False):
     tuple_types = expected_type.__args__  # type: ignore
-    if len(tuple_types) == 2 and tuple_types[1] == Ellipsis:
-        element_type = tuple_types[0]
-        tuple_types = (element_type,) * len(container)
+    if len(tuple_types) == 2 and tuple_types[1] is Ellipsis:
+        _handle_homogeneous(attribute, container, tuple_types[0], strict_types)
+        return
 
     if len(container) != len(tuple_types):
         raise TupleError(container, attribute.type, tuple_types)
 
+    if _plain_classes(tuple_types) is not None:
+        for element, element_type in zip(container, tuple_types):
+            if not _is_instance(element, element_type, strict_types):
+                raise _element_type_error(attribute, element, container)
+        return
+
     for element, expected_type in zip(container, tuple_types):
         try:
-            _validate_elements(attribute, element, expected_type)
+            _validate_elements(attribute, element, expected_type, strict_types)
         except BadTypeError as error:
             error.add_container(container)
             raise error
 
 
-def _handle_union(attribute, value, expected_type):
-    union_has_none_type = any(
-        elem is None.__class__ for elem in expected_type.__args__
-    )
+def _handle_union(attribute, value, expected_type, strict_types=False):
+    union_args = expected_type.__args__
 
-    if value is None and union_has_none_type:
+    if value is None and _NONE_TYPE in union_args:
         return
 
-    for arg in expected_type.__args__:
-        try:
-            _validate_elements(attribute, value, arg)
+    plain_classes = _plain_classes(union_args)
+    if plain_classes is not None:
+        if strict_types:
+            matched = any(
+                _is_instance(value, type_, strict_types)
+                for type_ in plain_classes
+            )
+        else:
+            matched = isinstance(value, plain_classes)
+        if matched:
+            return
+        raise UnionError(value, attribute.name, expected_type)
+
+    for arg in union_args:
+        if _matches_elements(attribute, value, arg, strict_types):
             return
-        except ValueError:
-            pass
     raise UnionError(value, attribute.name, expected_type)
 
 
+def _matches_elements(attribute, value, expected_type, strict_types=False):
+    """
+    Boolean counterpart of :func:`_validate_elements`.
+
+    A value of the wrong type is rejected without raising; errors are only
+    raised and caught when a container, union or callable has to be checked
+    in depth.
+
+    """
+    if expected_type is None or expected_type is typing.Any:
+        return True
+
+    base_type = _get_base_type(expected_type)
+
+    if base_type is typing.Any:
+        return True
+
+    if isinstance(base_type, (str, ForwardRef)):
+        raise _StringAnnotationError()
+
+    if base_type is _UNION:  # type: ignore
+        try:
+            _handle_union(attribute, value, expected_type, strict_types)
+        except ValueError:
+            return False
+        return True
+
+    if not _is_instance(value, base_type, strict_types):
+        return False
+
+    handler = _HANDLERS.get(base_type)
+    if handler is None:
+        return True
+
+    try:
+        handler(attribute, value, expected_type, strict_types)
+    except ValueError:
+        return False
+    return True
+
+
+_HANDLERS = {
+    type_: handler
+    for types, handler in (
+        (SimilarTypes.List, _handle_set_or_list),
+        (SimilarTypes.Dict, _handle_dict),
+        (SimilarTypes.Tuple, _handle_tuple),
+        (SimilarTypes.Callable, _handle_callable),
+    )
+    for type_ in types
+}  # type: typing.Dict[typing.Any, typing.Callable[..., None]]
+
+
 # -----------------------------------------------------------------------------
 # Copyright 2019 Bloomberg Finance L.P.
 #
@@ -1,6 +1,16 @@
+import inspect
 import typing
+import weakref
+
 import attr
 
+from ._error import AttributeTypeError
+
+_SIGNATURES: weakref.WeakKeyDictionary[
+    typing.Callable[..., typing.Any],
+    typing.Tuple[inspect.Signature, typing.Tuple[typing.Any, ...]],
+]
+
 def resolve_types(
     cls: type,
     global_ns: typing.Optional[typing.Dict[str, typing.Any]] = None,
@@ -8,6 +18,7 @@ def resolve_types(
 ) -> None: ...
 def type_validator(
     empty_ok: bool = True,
+    strict_types: bool = False,
 ) -> typing.Callable[
     [typing.Any, attr.Attribute[typing.Any], typing.Any], None
 ]:
@@ -18,21 +29,83 @@ def type_validator(
     ) -> None: ...
     return _validator
 
+def _install_validator(
+    cls: type, attribute: attr.Attribute[typing.Any], strict_types: bool
+) -> typing.Callable[[attr.Attribute[typing.Any], typing.Any], None]: ...
+def _compile_validator(
+    expected_type: typing.Optional[typing.Type[typing.Any]],
+    strict_types: bool = False,
+) -> typing.Callable[[attr.Attribute[typing.Any], typing.Any], None]:
+    def _validate_attribute_type(
+        attribute: attr.Attribute[typing.Any], value: typing.Any
+    ) -> None: ...
+    return _validate_attribute_type
+
+def _instance_validator(
+    expected_type: typing.Type[typing.Any], strict_types: bool
+) -> typing.Callable[[attr.Attribute[typing.Any], typing.Any], None]:
+    def _validate_exact_instance(
+        attribute: attr.Attribute[typing.Any], value: typing.Any
+    ) -> None: ...
+    def _validate_instance(
+        attribute: attr.Attribute[typing.Any], value: typing.Any
+    ) -> None: ...
+    return _validate_instance
+
+def _set_or_list_validator(
+    container_type: typing.Type[typing.Any],
+    element_type: typing.Type[typing.Any],
+    strict_types: bool,
+) -> typing.Callable[[attr.Attribute[typing.Any], typing.Any], None]:
+    def _validate_exact_set_or_list(
+        attribute: attr.Attribute[typing.Any], value: typing.Any
+    ) -> None: ...
+    def _validate_set_or_list(
+        attribute: attr.Attribute[typing.Any], value: typing.Any
+    ) -> None: ...
+    return _validate_set_or_list
+
+def _validate_nothing(
+    attribute: attr.Attribute[typing.Any], value: typing.Any
+) -> None: ...
+def _is_instance(
+    value: typing.Any, type_: typing.Type[typing.Any], strict_types: bool
+) -> bool: ...
 def _validate_elements(
     attribute: attr.Attribute[typing.Any],
     value: typing.Any,
     expected_type: typing.Optional[typing.Type[typing.Any]],
+    strict_types: bool = False,
 ) -> None: ...
 def _get_base_type(
     type_: typing.Type[typing.Any],
 ) -> typing.Type[typing.Any]: ...
+def _is_plain_class(type_: typing.Any) -> bool: ...
+def _plain_classes(
+    types: typing.Tuple[typing.Any, ...],
+) -> typing.Optional[typing.Tuple[typing.Type[typing.Any], ...]]: ...
+def _element_type_error(
+    attribute: attr.Attribute[typing.Any],
+    element: typing.Any,
+    container: typing.Any,
+) -> AttributeTypeError: ...
 def _type_matching(
     actual: typing.Type[typing.Any], expected: typing.Type[typing.Any]
 ) -> bool: ...
+def _callable_signature(
+    callable_: typing.Callable[..., typing.Any],
+) -> typing.Tuple[inspect.Signature, typing.Tuple[typing.Any, ...]]: ...
+def _function_signature(
+    function: typing.Callable[..., typing.Any],
+) -> typing.Tuple[inspect.Signature, typing.Tuple[typing.Any, ...]]: ...
+def _compute_signature(
+    callable_: typing.Callable[..., typing.Any],
+) -> typing.Tuple[inspect.Signature, typing.Tuple[typing.Any, ...]]: ...
 def _handle_callable(
     attribute: attr.Attribute[typing.Any],
     callable_: typing.Callable[..., typing.Any],
     expected_type: typing.Type[typing.Callable[..., typing.Any]],
+    strict_types: bool = False,
 ) -> None: ...
 def _handle_set_or_list(
     attribute: attr.Attribute[typing.Any],
@@ -41,6 +114,13 @@ def _handle_set_or_list(
         typing.Type[typing.Set[typing.Any]],
         typing.Type[typing.List[typing.Any]],
     ],
+    strict_types: bool = False,
+) -> None: ...
+def _handle_homogeneous(
+    attribute: attr.Attribute[typing.Any],
+    container: typing.Iterable[typing.Any],
+    element_type: typing.Type[typing.Any],
+    strict_types: bool,
 ) -> None: ...
 def _handle_dict(
     attribute: attr.Attribute[typing.Any],
@@ -52,14 +132,23 @@ def _handle_dict(
         typing.Type[typing.Mapping[typing.Any, typing.Any]],
         typing.Type[typing.MutableMapping[typing.Any, typing.Any]],
     ],
+    strict_types: bool = False,
 ) -> None: ...
 def _handle_tuple(
     attribute: attr.Attribute[typing.Any],
     container: typing.Tuple[typing.Any],
     expected_type: typing.Type[typing.Tuple[typing.Any]],
+    strict_types: bool = False,
 ) -> None: ...
 def _handle_union(
     attribute: attr.Attribute[typing.Any],
     value: typing.Any,
     expected_type: typing.Type[typing.Any],
+    strict_types: bool = False,
 ) -> None: ...
+def _matches_elements(
+    attribute: attr.Attribute[typing.Any],
+    value: typing.Any,
+    expected_type: typing.Optional[typing.Type[typing.Any]],
+    strict_types: bool = False,
+) -> bool: ...
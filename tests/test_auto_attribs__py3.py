@@ -1,9 +1,14 @@
+import gc
+import sys
+import types
+import weakref
 from typing import Optional
 
 import attr
 import pytest
 
-from attrs_strict import type_validator
+from attrs_strict import _type_validation, type_validator
+from attrs_strict._commons import is_newtype
 
 
 @pytest.mark.parametrize(
@@ -52,3 +57,35 @@ def test_recursive():
 
     with pytest.raises(ValueError):
         Self(Self(17))
+
+
+def test_resolved_class_can_be_collected():
+    module = types.ModuleType("_attrs_strict_collectable")
+    sys.modules[module.__name__] = module
+    try:
+        exec(
+            "import attr\n"
+            "from attrs_strict import type_validator\n"
+            "@attr.s(auto_attribs=True)\n"
+            "class Node:\n"
+            "    peer: 'Node' = attr.ib(validator=type_validator())\n",
+            module.__dict__,
+        )
+        with pytest.raises(ValueError):
+            module.Node(15)
+        node_ref = weakref.ref(module.Node)
+    finally:
+        del sys.modules[module.__name__]
+    del module
+
+    # The bounded memoization caches hold on to recently validated types.
+    for function in (
+        is_newtype,
+        _type_validation._compile_validator,
+        _type_validation._get_base_type,
+        _type_validation._is_plain_class,
+        _type_validation._plain_classes,
+    ):
+        function.cache_clear()
+    gc.collect()
+    assert node_ref() is None
@@ -1,3 +1,5 @@
+import typing
+
 import attr
 import pytest
 
@@ -41,3 +43,67 @@ def test_reassign_evaluate():
     assert repr(
         error.value
     ) == "<number must be {} (got 5 that is a {})>".format(str, int)
+
+
+def test_strict_types_rejects_subclass_instances():
+    @attr.s
+    class Something(object):
+        number = attr.ib(validator=type_validator(strict_types=True), type=int)
+
+    Something(number=5)
+    with pytest.raises(ValueError) as error:
+        Something(number=True)
+
+    assert repr(
+        error.value
+    ) == "<number must be {} (got True that is a {})>".format(int, bool)
+
+
+def test_default_types_accept_subclass_instances():
+    @attr.s
+    class Something(object):
+        number = attr.ib(validator=type_validator(), type=int)
+
+    Something(number=True)
+
+
+def test_validators_with_different_strictness_on_same_attribute():
+    @attr.s
+    class Something(object):
+        number = attr.ib(
+            validator=[type_validator(), type_validator(strict_types=True)],
+            type=int,
+        )
+
+    Something(number=5)
+    Something(number=6)
+    with pytest.raises(ValueError):
+        Something(number=True)
+
+
+@pytest.mark.parametrize(
+    "type_, good_value, bad_value",
+    [
+        (typing.Optional[int], 1, True),
+        (typing.Union[int, typing.List[int]], [1], [True]),
+        (typing.Dict[str, int], {"x": 1}, {"x": True}),
+        (typing.Dict[str, typing.List[int]], {"x": [1]}, {"x": [True]}),
+        (typing.Tuple[int, int], (1, 2), (True, False)),
+        (typing.Tuple[int, ...], (1, 2), (1, True)),
+        (typing.List[typing.List[int]], [[1]], [[True]]),
+    ],
+)
+def test_strict_types_applies_to_nested_types(type_, good_value, bad_value):
+    @attr.s
+    class Something(object):
+        value = attr.ib(validator=type_validator(strict_types=True), type=type_)
+
+    Something(value=good_value)
+    with pytest.raises(ValueError):
+        Something(value=bad_value)
+
+    @attr.s
+    class Lenient(object):
+        value = attr.ib(validator=type_validator(), type=type_)
+
+    Lenient(value=bad_value)
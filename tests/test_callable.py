@@ -1,5 +1,7 @@
+import gc
 import sys
 import typing
+import weakref
 
 import attr
 import pytest
@@ -72,6 +74,11 @@ class _TestResources:
 
     int_default_returns_int.__annotations__ = {"a": int, "return": int}
 
+    def bare_dict_returns_int(a):
+        pass
+
+    bare_dict_returns_int.__annotations__ = {"a": dict, "return": int}
+
 
 @not_on_py2
 @pytest.mark.parametrize(
@@ -205,6 +212,12 @@ def test_callable_not_raises_with_valid_annotations(
             typing.List[typing.Callable[[int, int], str]],
             CallableError,
         ),
+        (
+            "unparametrized_arg_for_parametrized_type",
+            _TestResources.bare_dict_returns_int,
+            typing.Callable[[typing.Dict[str, int]], int],
+            CallableError,
+        ),
     ],
 )
 def test_callable_raises_with_invalid_types(
@@ -216,3 +229,49 @@ def test_callable_raises_with_invalid_types(
 
     with pytest.raises(raised_error_type):
         Something(call_me=callable_)
+
+
+class _Holder(object):
+    def int_returns_str(self, a):
+        pass
+
+    int_returns_str.__annotations__ = {"a": int, "return": str}
+
+
+@not_on_py2
+@pytest.mark.parametrize(
+    "attribute_type, valid",
+    [
+        (typing.Callable[[int], str], True),
+        (typing.Callable[[str], str], False),
+    ],
+)
+def test_callable_bound_method(attribute_type, valid):
+    @attr.s
+    class Something(object):
+        call_me = attr.ib(validator=type_validator(), type=attribute_type)
+
+    holder = _Holder()
+    for _ in range(2):
+        if valid:
+            Something(call_me=holder.int_returns_str)
+        else:
+            with pytest.raises(CallableError):
+                Something(call_me=holder.int_returns_str)
+
+
+@not_on_py2
+def test_validated_bound_method_instance_can_be_collected():
+    @attr.s
+    class Something(object):
+        call_me = attr.ib(
+            validator=type_validator(), type=typing.Callable[[int], str]
+        )
+
+    holder = _Holder()
+    holder_ref = weakref.ref(holder)
+    Something(call_me=holder.int_returns_str)
+
+    del holder
+    gc.collect()
+    assert holder_ref() is None
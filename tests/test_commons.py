@@ -0,0 +1,52 @@
+import pytest
+
+from attrs_strict._commons import cached, is_newtype, lru_cache
+
+
+@pytest.mark.skipif(lru_cache is None, reason="lru_cache is not available")
+def test_cached_reuses_result():
+    calls = []
+
+    @cached(maxsize=8)
+    def square(value):
+        calls.append(value)
+        return value * value
+
+    assert square(3) == 9
+    assert square(3) == 9
+    assert len(calls) == 1
+
+
+def test_cached_unhashable_argument_bypasses_cache():
+    @cached(maxsize=8)
+    def length(value):
+        return len(value)
+
+    assert length([1, 2, 3]) == 3
+    assert length([1]) == 1
+
+
+def test_cached_type_error_from_function_is_not_retried():
+    calls = []
+
+    @cached(maxsize=8)
+    def fail(value):
+        calls.append(value)
+        raise TypeError("failed")
+
+    with pytest.raises(TypeError):
+        fail(1)
+    assert calls == [1]
+
+
+def test_is_newtype_unhashable_type():
+    assert not is_newtype([int])
+
+
+def test_cached_keyword_arguments_bypass_cache():
+    @cached(maxsize=8)
+    def add(left, right=0):
+        return left + right
+
+    assert add(1, right=2) == 3
+    assert add(1, 2) == 3
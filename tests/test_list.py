@@ -92,3 +92,26 @@ def test_list_of_valid_values_no_raise(values, type_):
     attrib.type = type_
 
     validator(None, attrib, values)
+
+
+@pytest.mark.parametrize(
+    "values, type_, valid",
+    [
+        ([1, 2, 3], List[int], True),
+        ([1, True, 3], List[int], False),
+        ({1.5, 2.5}, Set[float], True),
+        ({1.5, 2}, Set[float], False),
+    ],
+)
+def test_list_of_values_with_strict_types(values, type_, valid):
+    validator = type_validator(strict_types=True)
+
+    attrib = MagicMock()
+    attrib.name = "numbers"
+    attrib.type = type_
+
+    if valid:
+        validator(None, attrib, values)
+    else:
+        with pytest.raises(ValueError):
+            validator(None, attrib, values)
@@ -30,6 +30,12 @@ except ImportError:
                 )
             ),
         ),
+        (
+            [1, "p"],
+            Union[List[int], str],
+            "Value of foo [1, 'p'] is not of type "
+            "typing.Union[typing.List[int], str]",
+        ),
     ],
 )
 def test_union_when_type_is_not_specified_raises(element, type_, error_message):
@@ -53,6 +59,8 @@ def test_union_when_type_is_not_specified_raises(element, type_, error_message):
         (2.0, Union[int, float]),
         ([1, 2, None, 4, 5], List[Union[None, int]]),
         (None, Union[int, None]),
+        ([1, 2], Union[List[int], str]),
+        ("foo", Union[List[int], str]),
     ],
 )
 def test_union_not_raise_for_correct_values(element, type_):